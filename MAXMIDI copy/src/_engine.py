@@ -0,0 +1,61 @@
+"""
+Bulk note-event renderer.
+
+Shared realtime loop for pattern and arpeggio playback. Callers
+precompute their whole schedule — time-sorted event columns of absolute
+offsets, status bytes and data bytes — and this module walks it with
+sleep-to-deadline plus a single send per event. All musical math,
+sorting and humanization draws happen before the loop starts; the loop
+body itself is nothing but array indexing, one nanosleep and one send.
+"""
+
+import time
+
+from .clock import _sleep_until_ns
+
+
+def note_schedule(offsets_ns, notes, velocities, gate_ns, channel=0):
+    """
+    Expand per-note rows into interleaved, time-sorted on/off event
+    columns suitable for render().
+
+    offsets_ns: note-on offsets (ns) relative to the schedule start
+    gate_ns:    how long each note sounds before its note-off
+    Returns (offsets_ns, statuses, data1, data2) parallel lists.
+    """
+    on = 0x90 | channel
+    off = 0x80 | channel
+
+    events = []
+    for t, note, vel in zip(offsets_ns, notes, velocities):
+        events.append((t, on, note, vel))
+        events.append((t + gate_ns, off, note, 0))
+    events.sort()
+
+    return (
+        [e[0] for e in events],
+        [e[1] for e in events],
+        [e[2] for e in events],
+        [e[3] for e in events],
+    )
+
+
+def render(send, offsets_ns, statuses, data1, data2, start_ns=None):
+    """
+    Emit precomputed MIDI events at absolute deadlines.
+
+    send:       bound message sender, e.g. Midi.send or MidiOut.send
+    offsets_ns: ascending per-event offsets from start_ns
+
+    Deadlines are absolute (start_ns + offset), so long schedules cannot
+    drift the way chained relative sleeps do. Returns start_ns so
+    callers can chain consecutive schedules gaplessly.
+    """
+    if start_ns is None:
+        start_ns = time.perf_counter_ns()
+
+    for i in range(len(offsets_ns)):
+        _sleep_until_ns(start_ns + offsets_ns[i])
+        send(statuses[i], data1[i], data2[i])
+
+    return start_ns
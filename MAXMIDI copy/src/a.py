@@ -1,17 +1,16 @@
 # mymidi.py
-from midiutil import MIDIFile
+from .file import MetaEvent, MidiFile
 
 def create_simple_midi(filename="output.mid"):
-    midi = MIDIFile(1)
-    track = 0
-    time = 0
-    midi.addTrackName(track, time, "Sample Track")
-    midi.addTempo(track, time, 120)
+    mf = MidiFile()
+    track = mf.add_track()
+    track.add_event(MetaEvent(0, 0x03, b"Sample Track"))  # track name
+    track.tempo(0, 120)
 
-    midi.addNote(track, channel=0, pitch=60, time=0, duration=1, volume=100)
-    midi.addNote(track, channel=0, pitch=64, time=1, duration=1, volume=100)
-    midi.addNote(track, channel=0, pitch=67, time=2, duration=1, volume=100)
+    # C major arpeggio, one quarter note (480 ticks) each
+    for pitch in (60, 64, 67):
+        track.note_on(0, pitch, 100)
+        track.note_off(480, pitch)
 
-    with open(filename, "wb") as output_file:
-        midi.writeFile(output_file)
-    print(f"MIDI saved as {filename}")
\ No newline at end of file
+    mf.save(filename)
+    print(f"MIDI saved as {filename}")
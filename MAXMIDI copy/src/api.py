@@ -10,13 +10,15 @@ import time
 from contextlib import contextmanager
 
 from .out import MidiOut
-from .message import (
-    note_on,
-    note_off,
-    control_change,
-    program_change,
-    pitch_bend,
-)
+from .message import _PB_LSB, _PB_MSB
+
+# Per-channel status bytes, shared by all Midi instances. Indexing these
+# replaces the message-builder call + tuple unpack on the per-note path.
+_STATUS_NOTE_ON = bytes(0x90 | c for c in range(16))
+_STATUS_NOTE_OFF = bytes(0x80 | c for c in range(16))
+_STATUS_CONTROL = bytes(0xB0 | c for c in range(16))
+_STATUS_PROGRAM = bytes(0xC0 | c for c in range(16))
+_STATUS_PITCH_BEND = bytes(0xE0 | c for c in range(16))
 
 
 class Midi:
@@ -87,13 +89,11 @@ class Midi:
 
     def note_on(self, note, velocity=100, channel=None):
         ch = self.channel if channel is None else channel
-        msg = note_on(note, velocity, ch)
-        self._out.send(*msg)
+        self._out.send(_STATUS_NOTE_ON[ch], note, velocity)
 
     def note_off(self, note, velocity=0, channel=None):
         ch = self.channel if channel is None else channel
-        msg = note_off(note, velocity, ch)
-        self._out.send(*msg)
+        self._out.send(_STATUS_NOTE_OFF[ch], note, velocity)
 
     def play_note(self, note, velocity=100, duration=0.5, channel=None):
         self.note_on(note, velocity, channel)
@@ -102,21 +102,19 @@ class Midi:
 
     def control_change(self, controller, value, channel=None):
         ch = self.channel if channel is None else channel
-        msg = control_change(controller, value, ch)
-        self._out.send(*msg)
+        self._out.send(_STATUS_CONTROL[ch], controller, value)
 
     def program_change(self, program, channel=None):
         ch = self.channel if channel is None else channel
-        msg = program_change(program, ch)
-        self._out.send(*msg)
+        self._out.send(_STATUS_PROGRAM[ch], program, 0)
 
     def pitch_bend(self, value, channel=None):
         """
         value: -8192 .. 8191
         """
         ch = self.channel if channel is None else channel
-        msg = pitch_bend(value, ch)
-        self._out.send(*msg)
+        v = max(-8192, min(8191, int(value))) + 8192
+        self._out.send(_STATUS_PITCH_BEND[ch], _PB_LSB[v], _PB_MSB[v])
 
 
 # -----------------------------------------------------
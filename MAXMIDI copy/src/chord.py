@@ -2,7 +2,11 @@
 Chord utilities and playback helpers.
 """
 
-from typing import List
+import functools
+from typing import List, Tuple
+
+from . import _engine
+from .message_batch import note_off_batch, note_on_batch
 
 # -------------------------------------------------
 # Note name utilities
@@ -23,22 +27,72 @@ NOTE_NAMES = {
 # Chord formulas (intervals in semitones)
 # -------------------------------------------------
 
+# Interval sets are immutable bytes (one uint8 per semitone offset):
+# no per-chord list allocation, and iteration yields plain ints.
 CHORD_TYPES = {
-    "":      [0, 4, 7],        # major
-    "m":     [0, 3, 7],        # minor
-    "dim":   [0, 3, 6],
-    "aug":   [0, 4, 8],
-    "7":     [0, 4, 7, 10],
-    "maj7":  [0, 4, 7, 11],
-    "m7":    [0, 3, 7, 10],
-    "m7b5":  [0, 3, 6, 10],
-    "sus2":  [0, 2, 7],
-    "sus4":  [0, 5, 7],
-    "6":     [0, 4, 7, 9],
-    "9":     [0, 4, 7, 10, 14],
+    "":      bytes([0, 4, 7]),        # major
+    "m":     bytes([0, 3, 7]),        # minor
+    "dim":   bytes([0, 3, 6]),
+    "aug":   bytes([0, 4, 8]),
+    "7":     bytes([0, 4, 7, 10]),
+    "maj7":  bytes([0, 4, 7, 11]),
+    "m7":    bytes([0, 3, 7, 10]),
+    "m7b5":  bytes([0, 3, 6, 10]),
+    "sus2":  bytes([0, 2, 7]),
+    "sus4":  bytes([0, 5, 7]),
+    "6":     bytes([0, 4, 7, 9]),
+    "9":     bytes([0, 4, 7, 10, 14]),
 }
 
 
+# -------------------------------------------------
+# Cached parse / build helpers
+# -------------------------------------------------
+
+@functools.lru_cache(maxsize=1024)
+def _parse_name(name: str) -> Tuple[str, str]:
+    """
+    Split a chord name into (root_name, chord_type), memoized.
+    """
+    # Root note (C, C#, Db, etc.)
+    if len(name) >= 2 and name[:2] in NOTE_NAMES:
+        root = name[:2]
+        rest = name[2:]
+    else:
+        root = name[:1]
+        rest = name[1:]
+
+    if root not in NOTE_NAMES:
+        raise ValueError(f"Invalid chord root: {root}")
+
+    if rest not in CHORD_TYPES:
+        raise ValueError(f"Unsupported chord type: {rest}")
+
+    return root, rest
+
+
+@functools.lru_cache(maxsize=1024)
+def _chord_notes(root: int, chord_type: str, octave: int, inversion: int) -> Tuple[int, ...]:
+    """
+    MIDI note numbers for a chord voicing, memoized.
+
+    Inversion is a slice rotation rather than repeated pop-from-head,
+    so deep inversions stay O(n).
+    """
+    base = (octave + 1) * 12 + root
+    notes = [base + i for i in CHORD_TYPES[chord_type]]
+
+    if inversion:
+        n = len(notes)
+        shift, k = divmod(inversion, n)
+        notes = (
+            [x + 12 * shift for x in notes[k:]]
+            + [x + 12 * (shift + 1) for x in notes[:k]]
+        )
+
+    return tuple(notes)
+
+
 # -------------------------------------------------
 # Chord class
 # -------------------------------------------------
@@ -64,21 +118,7 @@ class Chord:
     # -------------------------------------------------
 
     def _parse(self, name: str):
-        # Root note (C, C#, Db, etc.)
-        if len(name) >= 2 and name[:2] in NOTE_NAMES:
-            root = name[:2]
-            rest = name[2:]
-        else:
-            root = name[:1]
-            rest = name[1:]
-
-        if root not in NOTE_NAMES:
-            raise ValueError(f"Invalid chord root: {root}")
-
-        if rest not in CHORD_TYPES:
-            raise ValueError(f"Unsupported chord type: {rest}")
-
-        return root, rest
+        return _parse_name(name)
 
     # -------------------------------------------------
 
@@ -86,15 +126,7 @@ class Chord:
         """
         Return MIDI note numbers for the chord.
         """
-        base = (self.octave + 1) * 12 + self.root
-        notes = [base + i for i in self.intervals]
-
-        # Apply inversion
-        for _ in range(inversion):
-            n = notes.pop(0)
-            notes.append(n + 12)
-
-        return notes
+        return list(_chord_notes(self.root, self.chord_type, self.octave, inversion))
 
     # -------------------------------------------------
     # Playback helpers
@@ -106,22 +138,35 @@ class Chord:
         """
         notes = self.notes(inversion)
 
-        for n in notes:
-            midi.note_on(n, velocity)
+        # Pack all note-ons (and offs) before touching the port, then
+        # fire them back-to-back with nothing but the send between
+        # frames: the driver sees the whole chord in one scheduling
+        # quantum instead of one message per note_on() round trip.
+        ons = note_on_batch(notes, velocity)
+        offs = note_off_batch(notes)
+        send = midi.send
+
+        for i in range(0, len(ons), 3):
+            send(ons[i], ons[i + 1], ons[i + 2])
 
         midi.sleep(duration)
 
-        for n in notes:
-            midi.note_off(n)
+        for i in range(0, len(offs), 3):
+            send(offs[i], offs[i + 1], offs[i + 2])
 
     def arpeggiate(self, midi, velocity=100, step=0.1, inversion=0):
         """
         Play notes sequentially.
         """
-        for n in self.notes(inversion):
-            midi.note_on(n, velocity)
-            midi.sleep(step)
-            midi.note_off(n)
+        notes = self.notes(inversion)
+        step_ns = int(step * 1e9)
+        schedule = _engine.note_schedule(
+            [i * step_ns for i in range(len(notes))],
+            notes,
+            [velocity] * len(notes),
+            step_ns,
+        )
+        _engine.render(midi.send, *schedule)
 
 
 # -------------------------------------------------
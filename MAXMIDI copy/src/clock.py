@@ -6,6 +6,7 @@ MIDI Clock and Transport control.
 - MIDI Start / Stop / Continue
 """
 
+import sys
 import time
 import threading
 
@@ -17,6 +18,65 @@ from .message import continue_ as continue_msg
 
 DEFAULT_PPQN = 24  # MIDI clock pulses per quarter note
 
+# Realtime messages are fixed tuples; build each once at import instead
+# of calling the builder (and allocating) per send — the clock tuple in
+# particular would otherwise be rebuilt every tick.
+_CLOCK_TUPLE = clock_msg()
+_START_TUPLE = start_msg()
+_STOP_TUPLE = stop_msg()
+_CONTINUE_TUPLE = continue_msg()
+
+# Busy-wait for the final stretch of each tick. OS sleeps overshoot by
+# their timer slack (~50 us on Linux, up to several ms on Windows), which
+# is audible jitter at 24 PPQN; spinning the last few hundred us lands
+# the tick on its deadline.
+_SPIN_NS = 300_000
+
+
+if sys.platform.startswith("linux"):
+    # Sleep to an absolute CLOCK_MONOTONIC deadline via clock_nanosleep(2).
+    # An absolute deadline cannot accumulate drift the way chained
+    # relative sleeps do. time.perf_counter() reads CLOCK_MONOTONIC on
+    # Linux, so deadlines share the nanosleep timebase.
+    import ctypes
+
+    class _Timespec(ctypes.Structure):
+        _fields_ = [
+            ("tv_sec", ctypes.c_long),
+            ("tv_nsec", ctypes.c_long),
+        ]
+
+    _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+    _CLOCK_MONOTONIC = 1
+    _TIMER_ABSTIME = 1
+
+    def _sleep_until_ns(deadline_ns):
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        _libc.clock_nanosleep(
+            _CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None
+        )
+
+else:
+
+    def _sleep_until_ns(deadline_ns):
+        remaining = deadline_ns - time.perf_counter_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+
+
+def _set_timer_resolution(enable):
+    """
+    Request 1 ms timer resolution on Windows while the clock runs
+    (no-op elsewhere). Without it, sleeps can overshoot by 10-15 ms.
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        if enable:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        else:
+            ctypes.windll.winmm.timeEndPeriod(1)
+
 
 class MidiClock:
     """
@@ -39,7 +99,14 @@ class MidiClock:
         self.bpm = float(bpm)
         self.ppqn = int(ppqn)
 
-        self._running = False
+        # The tick interval is kept as a single precomputed int so the
+        # clock thread can read it atomically (GIL) without a lock.
+        self._interval_ns = int(60e9 / (self.bpm * self.ppqn))
+
+        # Lock-free stop signal for the tick loop; the lock below only
+        # serializes transport calls (start/stop/continue_).
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._thread = None
         self._lock = threading.Lock()
 
@@ -52,7 +119,7 @@ class MidiClock:
         """
         Seconds between MIDI clock ticks.
         """
-        return 60.0 / (self.bpm * self.ppqn)
+        return self._interval_ns * 1e-9
 
     # -------------------------------------------------
     # Transport
@@ -63,13 +130,13 @@ class MidiClock:
         Send MIDI Start and begin clock ticks.
         """
         with self._lock:
-            if self._running:
+            if not self._stop_event.is_set():
                 return
 
-            self._running = True
+            self._stop_event.clear()
 
             # Send MIDI Start
-            self._send(start_msg())
+            self._send(_START_TUPLE)
 
             self._thread = threading.Thread(
                 target=self._run,
@@ -82,25 +149,25 @@ class MidiClock:
         Stop clock ticks and send MIDI Stop.
         """
         with self._lock:
-            if not self._running:
+            if self._stop_event.is_set():
                 return
 
-            self._running = False
+            self._stop_event.set()
 
         # Send MIDI Stop
-        self._send(stop_msg())
+        self._send(_STOP_TUPLE)
 
     def continue_(self):
         """
         Send MIDI Continue and resume clock ticks.
         """
         with self._lock:
-            if self._running:
+            if not self._stop_event.is_set():
                 return
 
-            self._running = True
+            self._stop_event.clear()
 
-            self._send(continue_msg())
+            self._send(_CONTINUE_TUPLE)
 
             self._thread = threading.Thread(
                 target=self._run,
@@ -113,20 +180,29 @@ class MidiClock:
     # -------------------------------------------------
 
     def _run(self):
-        next_tick = time.perf_counter()
-
-        while True:
-            with self._lock:
-                if not self._running:
-                    break
-                interval = self.interval
-
-            next_tick += interval
-            self._send(clock_msg())
-
-            sleep_time = next_tick - time.perf_counter()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        _set_timer_resolution(True)
+        deadline_ns = time.perf_counter_ns()
+
+        # Bind the send method once: no hasattr probe or attribute walk
+        # per tick. MidiOut has no raw buffered stream to coalesce F8
+        # bytes into, so one short send per tick is the batching floor.
+        send = self.midi.send
+
+        try:
+            # No lock in the tick loop: the Event read is lock-free and
+            # _interval_ns is a single attribute read, atomic under the
+            # GIL, so tempo changes are picked up without syscalls.
+            while not self._stop_event.is_set():
+                deadline_ns += self._interval_ns
+                send(*_CLOCK_TUPLE)
+
+                # Sleep to just short of the deadline, then spin for the
+                # final margin to absorb OS sleep slack.
+                _sleep_until_ns(deadline_ns - _SPIN_NS)
+                while time.perf_counter_ns() < deadline_ns:
+                    pass
+        finally:
+            _set_timer_resolution(False)
 
     # -------------------------------------------------
     # Helpers
@@ -136,20 +212,16 @@ class MidiClock:
         """
         Send a MIDI message tuple.
         """
-        if hasattr(self.midi, "send"):
-            self.midi.send(*msg)
-        else:
-            # Assume MidiOut-like object
-            self.midi.send(*msg)
+        self.midi.send(*msg)
 
     # -------------------------------------------------
     # Configuration
     # -------------------------------------------------
 
     def set_bpm(self, bpm):
-        with self._lock:
-            self.bpm = float(bpm)
+        self.bpm = float(bpm)
+        self._interval_ns = int(60e9 / (self.bpm * self.ppqn))
 
     def set_ppqn(self, ppqn):
-        with self._lock:
-            self.ppqn = int(ppqn)
\ No newline at end of file
+        self.ppqn = int(ppqn)
+        self._interval_ns = int(60e9 / (self.bpm * self.ppqn))
\ No newline at end of file
@@ -6,16 +6,18 @@ A MidiDevice represents a single MIDI input or output port,
 with metadata and convenience helpers.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from .ports import list_inputs, list_outputs
 
 
-@dataclass(frozen=True)
-class MidiDevice:
+class MidiDevice(NamedTuple):
     """
     Represents a MIDI device/port.
+
+    A NamedTuple rather than a frozen dataclass: C-implemented, no
+    per-instance __dict__, and tuple equality/hashing — cheaper when
+    enumerating dozens of ports.
     """
     id: int
     name: str
@@ -46,27 +48,13 @@ def list_devices():
     """
     Return a list of all MIDI devices (inputs + outputs).
     """
-    devices = []
-
-    for i, name in enumerate(list_inputs()):
-        devices.append(
-            MidiDevice(
-                id=i,
-                name=name,
-                direction="input",
-            )
-        )
-
-    for i, name in enumerate(list_outputs()):
-        devices.append(
-            MidiDevice(
-                id=i,
-                name=name,
-                direction="output",
-            )
-        )
-
-    return devices
+    return [
+        MidiDevice(id=i, name=name, direction="input")
+        for i, name in enumerate(list_inputs())
+    ] + [
+        MidiDevice(id=i, name=name, direction="output")
+        for i, name in enumerate(list_outputs())
+    ]
 
 
 def list_input_devices():
@@ -98,14 +86,15 @@ def find_device(name: str, direction: str):
     Find a device by name and direction.
     """
     if direction == "input":
-        devices = list_input_devices()
+        names = list_inputs()
     elif direction == "output":
-        devices = list_output_devices()
+        names = list_outputs()
     else:
         raise ValueError("direction must be 'input' or 'output'")
 
-    for dev in devices:
-        if dev.name == name:
-            return dev
+    # Single backend enumeration; only the matching device is built.
+    for i, port_name in enumerate(names):
+        if port_name == name:
+            return MidiDevice(id=i, name=port_name, direction=direction)
 
     return None
\ No newline at end of file
@@ -2,8 +2,7 @@
 # src/drums.py
 
 from .note import Note  # Assuming you have a Note class; adjust if needed
-from .track import Track  # Or whatever your track class is
-from .clock import Clock  # If you have BPM/clock handling
+from .clock import _sleep_until_ns
 import random
 import time
 
@@ -47,6 +46,8 @@ class DrumPattern:
         self.velocity = 100         # Default velocity
         self.humanize_time = 0.0    # Max random offset in seconds
         self.humanize_vel = 0       # Max random velocity variation
+        self._sorted_hits = None    # Cached sorted view of self.events
+        self._sorted_len = 0
 
     # Helpers for common elements
     @property
@@ -109,26 +110,76 @@ class DrumPattern:
         return self
 
     # Playback
-    def play(self, loop: int = 1, duration: float = 0.1):  # Short note duration for drums
+    def hit(self, note, velocity=None, duration=0.1, channel=None):
+        """Fire a single hit right now. Song's scheduler plays patterns
+        as individual timed hits through this, so one pattern can't
+        monopolize its loop for a whole bar."""
+        Note(
+            note,
+            velocity=self.velocity if velocity is None else velocity,
+            channel=self.channel if channel is None else channel,
+        ).play(duration=duration)
+
+    def play(self, loop: int = 1, duration: float = 0.1, channel: int = None):
+        # channel overrides self.channel for this call only (Song passes
+        # the track channel this way instead of mutating the pattern).
         step_duration = (60 / self.bpm) / (self.steps // 4)  # Seconds per step
-
-        for _ in range(loop):
-            for step, note_num, vel in sorted(self.events):
-                # Wait until this step
-                time.sleep(step * step_duration - Clock.current_time if hasattr(Clock, 'current_time') else 0)
-
-                adjusted_vel = vel
-                adjusted_time = 0
-                if self.humanize_vel:
-                    adjusted_vel = max(1, vel + random.randint(-self.humanize_vel, self.humanize_vel))
-                if self.humanize_time:
-                    adjusted_time = random.uniform(-self.humanize_time, self.humanize_time)
-
-                # Send note_on + quick note_off
-                Note(note_num, velocity=adjusted_vel, channel=self.channel).play(duration=duration + adjusted_time)
-
-            # Reset for next loop if needed
-            time.sleep((self.steps * step_duration) - (len(self.events) * duration if self.events else 0))
+        bar_duration = self.steps * step_duration
+
+        # Precompute the whole timeline before entering the realtime loop:
+        # absolute per-hit offsets and every humanization draw up front —
+        # the loop body is just sleep-to-deadline and send. The sort is
+        # cached across play() calls; builder methods only ever append to
+        # self.events, so a length check detects staleness.
+        if self._sorted_hits is None or self._sorted_len != len(self.events):
+            self._sorted_hits = sorted(self.events)
+            self._sorted_len = len(self.events)
+        hits = self._sorted_hits
+        n_hits = len(hits)
+        offsets = [step * step_duration for step, _, _ in hits]
+        vels = [vel for _, _, vel in hits]
+
+        # Jitter comes from one locally bound random.random consumed
+        # arithmetically: no per-note randint/uniform dispatch (randint
+        # alone is several range checks and method calls per draw).
+        # The draws cover loop * n_hits slots — one per hit per bar —
+        # so repeated bars don't replay identical jitter.
+        rand = random.random
+        if self.humanize_vel:
+            hv = self.humanize_vel
+            span = 2 * hv + 1
+            vels = [max(1, v + int(rand() * span) - hv) for v in vels * loop]
+        else:
+            vels = vels * loop
+        if self.humanize_time:
+            ht = self.humanize_time
+            offsets = [
+                max(0.0, t + (rand() * 2.0 - 1.0) * ht) for t in offsets * loop
+            ]
+        else:
+            offsets = offsets * loop
+
+        # One reusable Note; per-hit pitch/velocity are plain field writes.
+        note = Note(
+            0,
+            velocity=self.velocity,
+            channel=self.channel if channel is None else channel,
+        )
+        start_ns = time.perf_counter_ns()
+
+        for bar in range(loop):
+            bar_start_ns = start_ns + int(bar * bar_duration * 1e9)
+            base = bar * n_hits
+
+            for (_, note_num, _), offset, vel in zip(
+                hits, offsets[base:base + n_hits], vels[base:base + n_hits]
+            ):
+                _sleep_until_ns(bar_start_ns + int(offset * 1e9))
+                note.pitch = note_num
+                note.velocity = vel
+                note.play(duration=duration)
+
+            _sleep_until_ns(bar_start_ns + int(bar_duration * 1e9))
 
     # Presets
     @classmethod
@@ -8,8 +8,9 @@ Supports:
 """
 
 import struct
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 
 
 # -------------------------------------------------
@@ -31,6 +32,16 @@ def _varlen(value: int) -> bytes:
     return bytes(reversed(out))
 
 
+# Precomputed varlen encodings for deltas < 0x4000 (covers the <=2-byte
+# values typical SMFs use almost exclusively). Indexing this table on the
+# save hot path avoids re-running the encode loop once per event.
+_VARLEN_SMALL = [_varlen(i) for i in range(1 << 14)]
+
+# Data-byte count per channel status nibble (0x8_..0xE_). Program Change
+# and Channel Aftertouch carry one data byte, everything else two.
+_STATUS_LEN = bytes([0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 1, 1, 2, 0])
+
+
 def _read_varlen(data: bytes, idx: int) -> Tuple[int, int]:
     """Decode variable-length quantity."""
     value = 0
@@ -53,6 +64,11 @@ class MidiEvent:
     status: int
     data: bytes = b""
 
+    def encode(self, out: bytearray):
+        """Append this event's wire bytes (status + data) to out."""
+        out.append(self.status)
+        out += self.data
+
 
 @dataclass
 class MetaEvent:
@@ -60,43 +76,130 @@ class MetaEvent:
     meta_type: int
     data: bytes = b""
 
+    def encode(self, out: bytearray):
+        """Append this event's wire bytes (FF type len data) to out."""
+        out.append(0xFF)
+        out.append(self.meta_type)
+        out += _varlen(len(self.data))
+        out += self.data
+
 
 # -------------------------------------------------
 # Track
 # -------------------------------------------------
 
-@dataclass
 class MidiTrack:
-    events: List[object] = field(default_factory=list)
+    """
+    A single MIDI track.
+
+    Events are stored struct-of-arrays: parallel columns of deltas,
+    status bytes and data bytes rather than one object per event. This
+    keeps a 100k-event track in a few contiguous buffers instead of
+    100k dataclass instances, and lets save() iterate raw bytes. Meta
+    events — and SysEx/system messages, whose payloads don't fit the
+    two data-byte columns — keep their payloads in sparse side tables
+    keyed by index.
+
+    The public ``events`` view still yields MidiEvent/MetaEvent
+    instances; they are built on demand, not stored.
+    """
+
+    def __init__(self):
+        self._deltas = array("I")
+        self._statuses = bytearray()
+        self._data1 = bytearray()
+        self._data2 = bytearray()
+        self._meta = {}  # event index -> (meta_type, data)
+        self._raw = {}   # event index -> data bytes (SysEx / system common)
+
+    def __len__(self):
+        return len(self._deltas)
+
+    @property
+    def events(self) -> Iterator[object]:
+        """
+        Iterate events as MidiEvent / MetaEvent instances.
+        """
+        meta = self._meta
+        raw = self._raw
+        statuses = self._statuses
+        data1 = self._data1
+        data2 = self._data2
+
+        for i, delta in enumerate(self._deltas):
+            status = statuses[i]
+            if status == 0xFF:
+                meta_type, data = meta[i]
+                yield MetaEvent(delta, meta_type, data)
+            elif status >= 0xF0:
+                yield MidiEvent(delta, status, raw[i])
+            elif status & 0xF0 in (0xC0, 0xD0):
+                yield MidiEvent(delta, status, bytes([data1[i]]))
+            else:
+                yield MidiEvent(delta, status, bytes([data1[i], data2[i]]))
+
+    # -------------------------------------------------
+    # Low-level appends (no per-event object allocation)
+    # -------------------------------------------------
+
+    def _append_channel(self, delta, status, data1, data2=0):
+        self._deltas.append(delta)
+        self._statuses.append(status)
+        self._data1.append(data1)
+        self._data2.append(data2)
+
+    def _append_meta(self, delta, meta_type, data):
+        self._meta[len(self._deltas)] = (meta_type, bytes(data))
+        self._deltas.append(delta)
+        self._statuses.append(0xFF)
+        self._data1.append(0)
+        self._data2.append(0)
+
+    def _append_raw(self, delta, status, data):
+        self._raw[len(self._deltas)] = bytes(data)
+        self._deltas.append(delta)
+        self._statuses.append(status)
+        self._data1.append(0)
+        self._data2.append(0)
+
+    # -------------------------------------------------
+    # Public event API
+    # -------------------------------------------------
 
     def add_event(self, event):
-        self.events.append(event)
+        if isinstance(event, MetaEvent):
+            self._append_meta(event.delta, event.meta_type, event.data)
+            return
+        data = event.data
+        status = event.status
+        if status >= 0xF0:
+            # SysEx / system common payloads are variable length; they
+            # go in the raw side table the way meta payloads do.
+            self._append_raw(event.delta, status, data)
+            return
+        if len(data) > 2:
+            raise ValueError(
+                f"channel status 0x{status:02X} carries at most two data bytes"
+            )
+        d1 = data[0] if len(data) > 0 else 0
+        d2 = data[1] if len(data) > 1 else 0
+        self._append_channel(event.delta, status, d1, d2)
 
     def note_on(self, delta, note, velocity, channel=0):
-        self.add_event(
-            MidiEvent(delta, 0x90 | channel, bytes([note, velocity]))
-        )
+        self._append_channel(delta, 0x90 | channel, note, velocity)
 
     def note_off(self, delta, note, velocity=0, channel=0):
-        self.add_event(
-            MidiEvent(delta, 0x80 | channel, bytes([note, velocity]))
-        )
+        self._append_channel(delta, 0x80 | channel, note, velocity)
 
     def tempo(self, delta, bpm):
         mpqn = int(60_000_000 / bpm)
-        self.add_event(
-            MetaEvent(delta, 0x51, struct.pack(">I", mpqn)[1:])
-        )
+        self._append_meta(delta, 0x51, struct.pack(">I", mpqn)[1:])
 
     def time_signature(self, delta, num, denom):
-        self.add_event(
-            MetaEvent(delta, 0x58, bytes([num, denom.bit_length() - 1, 24, 8]))
-        )
+        self._append_meta(delta, 0x58, bytes([num, denom.bit_length() - 1, 24, 8]))
 
     def key_signature(self, delta, key, minor=0):
-        self.add_event(
-            MetaEvent(delta, 0x59, struct.pack("bb", key, minor))
-        )
+        self._append_meta(delta, 0x59, struct.pack("bb", key, minor))
 
 
 # -------------------------------------------------
@@ -126,27 +229,83 @@ class MidiFile:
 
             # Track chunks
             for track in self.tracks:
-                track_data = bytearray()
-
-                for event in track.events:
-                    track_data += _varlen(event.delta)
-
-                    if isinstance(event, MidiEvent):
-                        track_data.append(event.status)
-                        track_data += event.data
-
-                    elif isinstance(event, MetaEvent):
-                        track_data += bytes([0xFF, event.meta_type])
-                        track_data += _varlen(len(event.data))
-                        track_data += event.data
-
-                # End of Track
-                track_data += _varlen(0)
-                track_data += b"\xFF\x2F\x00"
+                # Iterate the raw SoA columns: no per-event dataclass
+                # materialization or isinstance dispatch.
+                deltas = track._deltas
+                statuses = track._statuses
+                data1 = track._data1
+                data2 = track._data2
+                meta = track._meta
+                raw = track._raw
+
+                # Preallocate the whole track buffer: a channel event
+                # encodes to at most 8 bytes (5 varlen + status + 2 data),
+                # a meta or raw event to at most 12 plus its payload.
+                # Writing through a cursor means zero reallocations while
+                # encoding.
+                cap = 8 * len(deltas) + 16
+                if meta:
+                    cap += sum(4 + len(d) for _, d in meta.values())
+                if raw:
+                    cap += sum(len(d) for d in raw.values())
+                buf = bytearray(cap)
+                mv = memoryview(buf)
+                off = 0
+
+                # Running status: repeat channel events omit their status
+                # byte, roughly a 30% saving on note-dense tracks. Meta
+                # events cancel running status per the SMF spec.
+                prev_status = 0
+
+                for i in range(len(deltas)):
+                    delta = deltas[i]
+                    enc = _VARLEN_SMALL[delta] if delta < 0x4000 else _varlen(delta)
+                    end = off + len(enc)
+                    mv[off:end] = enc
+                    off = end
+
+                    status = statuses[i]
+                    if status < 0xF0:
+                        if status != prev_status:
+                            buf[off] = status
+                            off += 1
+                            prev_status = status
+                        buf[off] = data1[i]
+                        off += 1
+                        if _STATUS_LEN[status >> 4] == 2:
+                            buf[off] = data2[i]
+                            off += 1
+                    elif status != 0xFF:
+                        # SysEx / system common: status plus the stored
+                        # payload verbatim; cancels running status.
+                        prev_status = 0
+                        buf[off] = status
+                        off += 1
+                        payload = raw[i]
+                        end = off + len(payload)
+                        mv[off:end] = payload
+                        off = end
+                    else:
+                        prev_status = 0
+                        meta_type, meta_data = meta[i]
+                        buf[off] = 0xFF
+                        buf[off + 1] = meta_type
+                        off += 2
+                        size = len(meta_data)
+                        enc = _VARLEN_SMALL[size] if size < 0x4000 else _varlen(size)
+                        end = off + len(enc)
+                        mv[off:end] = enc
+                        end += size
+                        mv[end - size:end] = meta_data
+                        off = end
+
+                # End of Track (delta 0 + FF 2F 00)
+                mv[off:off + 4] = b"\x00\xFF\x2F\x00"
+                off += 4
 
                 f.write(b"MTrk")
-                f.write(struct.pack(">I", len(track_data)))
-                f.write(track_data)
+                f.write(struct.pack(">I", off))
+                f.write(mv[:off])
 
     # -------------------------------------------------
     # Read (basic)
@@ -180,10 +339,23 @@ class MidiFile:
             track = MidiTrack()
             midi.tracks.append(track)
 
+            # Tight parse loop: varlen decode is inlined and all names are
+            # locals, so each event costs a handful of bytecode ops instead
+            # of two function calls plus attribute lookups per iteration.
+            append_channel = track._append_channel
+            append_meta = track._append_meta
             running_status = None
 
             while idx < track_end:
-                delta, idx = _read_varlen(data, idx)
+                delta = 0
+                byte = data[idx]
+                idx += 1
+                while byte & 0x80:
+                    delta = (delta << 7) | (byte & 0x7F)
+                    byte = data[idx]
+                    idx += 1
+                delta = (delta << 7) | byte
+
                 status = data[idx]
 
                 if status < 0x80:
@@ -195,14 +367,21 @@ class MidiFile:
                 if status == 0xFF:
                     meta_type = data[idx]
                     idx += 1
-                    size, idx = _read_varlen(data, idx)
-                    meta_data = data[idx:idx+size]
+                    size = 0
+                    byte = data[idx]
+                    idx += 1
+                    while byte & 0x80:
+                        size = (size << 7) | (byte & 0x7F)
+                        byte = data[idx]
+                        idx += 1
+                    size = (size << 7) | byte
+                    append_meta(delta, meta_type, data[idx:idx+size])
                     idx += size
-                    track.add_event(MetaEvent(delta, meta_type, meta_data))
+                elif status & 0xF0 in (0xC0, 0xD0):
+                    append_channel(delta, status, data[idx])
+                    idx += 1
                 else:
-                    size = 1 if status & 0xF0 in (0xC0, 0xD0) else 2
-                    ev_data = data[idx:idx+size]
-                    idx += size
-                    track.add_event(MidiEvent(delta, status, ev_data))
+                    append_channel(delta, status, data[idx], data[idx+1])
+                    idx += 2
 
         return midi
\ No newline at end of file
@@ -14,6 +14,10 @@ MAXPNAMELEN = 32        # typical Windows MIDI device name length
 MIDIIN_DEFAULT = 0
 
 class MaxMidiIn(ctypes.Structure):
+    # Match the MSVC x64 default member alignment so the layout stays
+    # binary-compatible with the original C struct.
+    _pack_ = 8
+
     _fields_ = [
         ("hDevice", ctypes.c_uint64),                          # HMIN
         ("dwFlags", ctypes.c_uint32),                          # DWORD
@@ -26,17 +30,8 @@ class MaxMidiIn(ctypes.Structure):
         ("is_started", ctypes.c_int32),                        # BOOL
     ]
 
-    def __init__(self):
-        super().__init__()
-        self.hDevice = 0
-        self.dwFlags = MIDIIN_DEFAULT
-        self.wDeviceID = 0
-        self.is_open = 0
-        self.description = b""
-        self.hParentWnd = 0
-        self.pSync = 0
-        self.pTrack = 0
-        self.is_started = 0
+    # No __init__: ctypes.Structure() already zero-fills every field,
+    # and re-assigning defaults per instance is pure overhead.
 
     @property
     def description_str(self) -> str:
@@ -44,10 +39,12 @@ class MaxMidiIn(ctypes.Structure):
 
     @description_str.setter
     def description_str(self, text: str):
-        text_bytes = text.encode("ascii")[:MAXPNAMELEN]
-        self.description[:len(text_bytes)] = text_bytes
-        if len(text_bytes) < MAXPNAMELEN:
-            self.description[len(text_bytes):] = b"\x00" * (MAXPNAMELEN - len(text_bytes))
+        # memset + memmove: zero the field and copy the prefix in two C
+        # calls, instead of building a NUL-padded Python string per set.
+        raw = text.encode("ascii")[: MAXPNAMELEN - 1]
+        addr = ctypes.addressof(self) + MaxMidiIn.description.offset
+        ctypes.memset(addr, 0, MAXPNAMELEN)
+        ctypes.memmove(addr, raw, len(raw))
 
     def to_bytes(self) -> bytes:
         """Serialize the structure to bytes."""
@@ -62,11 +59,28 @@ class MaxMidiIn(ctypes.Structure):
         ctypes.memmove(ctypes.addressof(obj), data, len(data))
         return obj
 
-class MidiOut:
-    def get_port_count(self) -> int:
-        def get_port_name(self, index: int) -> str:
-            def open(self, index: int):
-                def close(self):
-                    def send(self, status, data1, data2):
-        
-        
\ No newline at end of file
+class MidiIn:
+    """
+    MIDI input port.
+
+    Mirrors MidiOut in out.py: a thin stateful wrapper over the
+    struct-backed device state that the port helpers (ports.py) can
+    construct, open by index, and close.
+    """
+
+    def __init__(self):
+        self.state = MaxMidiIn()
+        self.is_open = False
+
+    def open(self, port=MIDIIN_DEFAULT):
+        self.state.wDeviceID = port
+        self.state.is_open = 1
+        self.is_open = True
+
+    def open_default(self):
+        self.open(MIDIIN_DEFAULT)
+
+    def close(self):
+        self.state.is_started = 0
+        self.state.is_open = 0
+        self.is_open = False
@@ -13,22 +13,37 @@ to MidiOut.send(status, data1, data2).
 # -------------------------------------------------
 
 def _clamp7(value):
-    """Clamp to 7-bit unsigned int (0–127)."""
-    return max(0, min(127, int(value)))
+    """Mask to 7-bit unsigned int (0–127); negatives floor to 0."""
+    v = int(value)
+    return v & 0x7F if v >= 0 else 0
 
 
 def _clamp_channel(channel):
-    """Clamp MIDI channel to 0–15."""
-    return max(0, min(15, int(channel)))
+    """Mask MIDI channel to 0–15; negatives floor to 0."""
+    c = int(channel)
+    return c & 0x0F if c >= 0 else 0
 
 
 # -------------------------------------------------
 # Channel Voice Messages
 # -------------------------------------------------
 
+# All 16 status bytes per command, built once at import: each builder
+# does an indexed load instead of recomputing cmd | clamped-channel.
+# Indexing with `channel & 0x0F` also folds the channel clamp into the
+# load (Python's & wraps negatives into range).
+_NOTE_OFF_STATUS = bytes(0x80 | c for c in range(16))
+_NOTE_ON_STATUS = bytes(0x90 | c for c in range(16))
+_POLY_AT_STATUS = bytes(0xA0 | c for c in range(16))
+_CONTROL_STATUS = bytes(0xB0 | c for c in range(16))
+_PROGRAM_STATUS = bytes(0xC0 | c for c in range(16))
+_CHANNEL_AT_STATUS = bytes(0xD0 | c for c in range(16))
+_PITCH_BEND_STATUS = bytes(0xE0 | c for c in range(16))
+
+
 def note_on(note, velocity=100, channel=0):
     return (
-        0x90 | _clamp_channel(channel),
+        _NOTE_ON_STATUS[channel & 0x0F],
         _clamp7(note),
         _clamp7(velocity),
     )
@@ -36,7 +51,7 @@ def note_on(note, velocity=100, channel=0):
 
 def note_off(note, velocity=0, channel=0):
     return (
-        0x80 | _clamp_channel(channel),
+        _NOTE_OFF_STATUS[channel & 0x0F],
         _clamp7(note),
         _clamp7(velocity),
     )
@@ -44,7 +59,7 @@ def note_off(note, velocity=0, channel=0):
 
 def poly_aftertouch(note, pressure, channel=0):
     return (
-        0xA0 | _clamp_channel(channel),
+        _POLY_AT_STATUS[channel & 0x0F],
         _clamp7(note),
         _clamp7(pressure),
     )
@@ -52,7 +67,7 @@ def poly_aftertouch(note, pressure, channel=0):
 
 def control_change(controller, value, channel=0):
     return (
-        0xB0 | _clamp_channel(channel),
+        _CONTROL_STATUS[channel & 0x0F],
         _clamp7(controller),
         _clamp7(value),
     )
@@ -61,7 +76,7 @@ def control_change(controller, value, channel=0):
 def program_change(program, channel=0):
     # Program Change is 2 bytes, but we pad to 3 for uniformity
     return (
-        0xC0 | _clamp_channel(channel),
+        _PROGRAM_STATUS[channel & 0x0F],
         _clamp7(program),
         0,
     )
@@ -69,26 +84,30 @@ def program_change(program, channel=0):
 
 def channel_aftertouch(pressure, channel=0):
     return (
-        0xD0 | _clamp_channel(channel),
+        _CHANNEL_AT_STATUS[channel & 0x0F],
         _clamp7(pressure),
         0,
     )
 
 
+# All 16384 possible lsb/msb bytes, precomputed as two bytes tables
+# (32 KB total). Pitch-bend automation sends hundreds of messages a
+# second; the body below is three indexed loads and a tuple pack.
+_PB_LSB = bytes(v & 0x7F for v in range(16384))
+_PB_MSB = bytes((v >> 7) & 0x7F for v in range(16384))
+
+
 def pitch_bend(value, channel=0):
     """
     value: -8192 .. 8191
     """
-    value = int(value)
-    value = max(-8192, min(8191, value)) + 8192
-
-    lsb = value & 0x7F
-    msb = (value >> 7) & 0x7F
+    v = int(value)
+    v = (-8192 if v < -8192 else 8191 if v > 8191 else v) + 8192
 
     return (
-        0xE0 | _clamp_channel(channel),
-        lsb,
-        msb,
+        _PITCH_BEND_STATUS[channel & 0x0F],
+        _PB_LSB[v],
+        _PB_MSB[v],
     )
 
 
@@ -153,10 +172,24 @@ def reset():
 # SysEx (variable length)
 # -------------------------------------------------
 
+# Maps every byte to its low 7 bits; one translate() call clamps an
+# entire SysEx payload at C speed.
+_CLAMP7_TABLE = bytes(b & 0x7F for b in range(256))
+
+
 def sysex(data):
     """
-    data: iterable of ints (0–127)
+    data: bytes-like object or iterable of ints (0–127)
     Returns a bytes object instead of a 3-tuple.
     """
-    payload = bytes(_clamp7(b) for b in data)
-    return bytes([0xF0]) + payload + bytes([0xF7])
\ No newline at end of file
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+
+    # One allocation for the whole message: write the sentinels and
+    # translate() the clamped payload straight into the middle, instead
+    # of concatenating three bytes objects.
+    out = bytearray(len(data) + 2)
+    out[0] = 0xF0
+    out[-1] = 0xF7
+    out[1:-1] = data.translate(_CLAMP7_TABLE)
+    return bytes(out)
\ No newline at end of file
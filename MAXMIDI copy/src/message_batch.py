@@ -0,0 +1,71 @@
+"""
+Bulk MIDI message construction.
+
+Builders here pack many messages into one contiguous buffer of 3-byte
+(status, data1, data2) frames — a single allocation per pattern instead
+of one tuple (and three clamp calls) per event. The result is ready for
+a bulk sender, or can be indexed frame-by-frame by timed playback loops.
+"""
+
+# -------------------------------------------------
+# Column packers
+# -------------------------------------------------
+
+def _bytes7(values, n):
+    """Clamp a scalar or sequence to 0-127, broadcast to n bytes."""
+    if isinstance(values, int):
+        v = 0 if values < 0 else (127 if values > 127 else values)
+        return bytes([v]) * n
+    return bytes(
+        0 if v < 0 else (127 if v > 127 else int(v)) for v in values
+    )
+
+
+def _status_column(base, channels, n):
+    """Build the status column: base | clamped channel, broadcast to n."""
+    if isinstance(channels, int):
+        c = 0 if channels < 0 else (15 if channels > 15 else channels)
+        return bytes([base | c]) * n
+    return bytes(
+        base | (0 if c < 0 else (15 if c > 15 else int(c))) for c in channels
+    )
+
+
+def _pack(status_base, data1, data2, channels):
+    data1 = list(data1)
+    n = len(data1)
+
+    out = bytearray(3 * n)
+    out[0::3] = _status_column(status_base, channels, n)
+    out[1::3] = _bytes7(data1, n)
+    out[2::3] = _bytes7(data2, n)
+    return out
+
+
+# -------------------------------------------------
+# Batch builders
+# -------------------------------------------------
+
+def note_on_batch(notes, velocities=100, channels=0):
+    """
+    Pack note-on messages for many notes into one contiguous buffer.
+
+    notes: sequence of MIDI notes; velocities/channels may be scalars
+    (broadcast) or sequences of the same length.
+    Returns a bytearray of repeating (status, note, velocity) frames.
+    """
+    return _pack(0x90, notes, velocities, channels)
+
+
+def note_off_batch(notes, velocities=0, channels=0):
+    """
+    Pack note-off messages for many notes into one contiguous buffer.
+    """
+    return _pack(0x80, notes, velocities, channels)
+
+
+def control_change_batch(controllers, values, channels=0):
+    """
+    Pack control-change messages into one contiguous buffer.
+    """
+    return _pack(0xB0, controllers, values, channels)
@@ -6,6 +6,9 @@
 # ---------------------------------------------------------------------------
 
 import ctypes
+import heapq
+import struct
+from array import array
 from typing import List
 
 # ---------------------------------------------------------------------------
@@ -20,6 +23,10 @@ MERGE_BUFFER_SIZE = 512
 # struct MidiEvent { DWORD time; BYTE status; BYTE data1; BYTE data2; }
 # ---------------------------------------------------------------------------
 class MidiEvent(ctypes.Structure):
+    # Packed: 7 bytes of data, not 8 with alignment padding. Merge scans
+    # are sequential, so the denser layout fits more events per cache
+    # line and outweighs the minor unaligned-field access cost.
+    _pack_ = 1
     _fields_ = [
         ("time", ctypes.c_uint32),
         ("status", ctypes.c_uint8),
@@ -30,6 +37,9 @@ class MidiEvent(ctypes.Structure):
     def __init__(self, time=0, status=0, data1=0, data2=0):
         super().__init__(time, status, data1, data2)
 
+
+EVENT_SIZE = ctypes.sizeof(MidiEvent)  # 7 — matches the wire format below
+
 # ---------------------------------------------------------------------------
 # TrackMerge struct (Python container)
 # ---------------------------------------------------------------------------
@@ -78,82 +88,174 @@ class CMaxMidiOutState(ctypes.Structure):
         self.last_abs = 0
         self.tracks = None
         self.num_tracks = 0
-        self.merge_buffer = None
         self.merge_size = 0
         self.out_ptr = 0
 
+        # Pooled buffers, reused across merge_tracks calls instead of
+        # allocating fresh MidiEvent*N arrays per tick. Kept as Python
+        # attributes so the ctypes memory stays alive while the pointer
+        # fields reference it.
+        self._merge_storage = (MidiEvent * MERGE_BUFFER_SIZE)()
+        self.merge_buffer = self._merge_storage
+        self._track_storage = {}
+
 # ---------------------------------------------------------------------------
 # Track merge logic
 # ---------------------------------------------------------------------------
 def merge_tracks(state: CMaxMidiOutState) -> List[MidiEvent]:
-    merged = []
     any_sysex = False
     sysex_track = None
 
     tracks = [state.tracks[i] for i in range(state.num_tracks)]
 
+    # Pooled storage (lazily created for states not built via __init__).
+    storage = getattr(state, "_merge_storage", None)
+    if storage is None:
+        storage = state._merge_storage = (MidiEvent * MERGE_BUFFER_SIZE)()
+        state.merge_buffer = storage
+    track_storage = getattr(state, "_track_storage", None)
+    if track_storage is None:
+        track_storage = state._track_storage = {}
+
     # Load buffers
-    for tm in tracks:
+    for i, tm in enumerate(tracks):
+        # Events actually loaded this pass: tracks refilled below get
+        # the refill length, entries the caller preloaded (abs_buffer
+        # set, no track reference) keep their stated extent. buf_size
+        # itself stays the request capacity handed to get_abs_buffer —
+        # a short or empty refill must not shrink the next request.
+        tm._fill = tm.buf_size if tm.abs_buffer else 0
         # Call the abstract track's get_abs_buffer (requires proper ctypes wrapper)
         if tm.track:
-            # Assuming the track object has a get_abs_buffer() returning a Python list
+            # The track's get_abs_buffer() may return a MidiEvent ctypes
+            # array, a raw bytes blob of packed events, or a Python list.
             abs_buf = tm.track.contents.get_abs_buffer(tm.last_event, tm.buf_size)
-            buf_type = MidiEvent * len(abs_buf)
-            tm.abs_buffer = buf_type(*abs_buf)
+            if isinstance(abs_buf, (bytes, bytearray, memoryview)):
+                need = len(abs_buf) // EVENT_SIZE
+            else:
+                need = len(abs_buf)
+
+            # Reuse the track's pooled buffer when it still fits; only
+            # grow (never shrink) so steady-state refills allocate zero.
+            buf = track_storage.get(i)
+            if buf is None or len(buf) < need:
+                buf = (MidiEvent * max(need, MERGE_BUFFER_SIZE))()
+                track_storage[i] = buf
+
+            # Contiguous sources copy with one memmove — no per-event
+            # struct assignment (a Python->C transition each).
+            if isinstance(abs_buf, ctypes.Array):
+                ctypes.memmove(buf, abs_buf, need * EVENT_SIZE)
+            elif isinstance(abs_buf, (bytes, bytearray, memoryview)):
+                ctypes.memmove(buf, bytes(abs_buf), need * EVENT_SIZE)
+            else:
+                for j in range(need):
+                    buf[j] = abs_buf[j]
+
+            tm.abs_buffer = buf
+            tm._fill = need
             tm.this_event = 0
 
-            if tm.in_sysex and len(abs_buf):
+            if tm.in_sysex and need:
                 any_sysex = True
                 sysex_track = tm
 
-    while len(merged) < MERGE_BUFFER_SIZE:
-        candidate = None
-        candidate_track = None
+    # Flatten each track's event times into a contiguous uint32 array:
+    # the comparison path below then indexes plain ints instead of going
+    # through the ctypes field descriptor (full struct load) per compare.
+    times = [
+        array("I", (tm.abs_buffer[j].time for j in range(tm._fill)))
+        if tm.abs_buffer
+        else array("I")
+        for tm in tracks
+    ]
+
+    # K-way merge via a heap of (head_time, track_idx): each output slot
+    # costs O(log k) instead of a linear scan over every track.
+    heap = [
+        (times[i][tm.this_event], i)
+        for i, tm in enumerate(tracks)
+        if tm.abs_buffer and tm.this_event < tm._fill
+    ]
+    heapq.heapify(heap)
+    sysex_idx = tracks.index(sysex_track) if sysex_track is not None else -1
 
-        for tm in tracks:
-            if not tm.abs_buffer or tm.this_event >= tm.buf_size:
+    n_merged = 0
+    merged_times = []  # plain ints, feeds the delta pass below
+    while n_merged < MERGE_BUFFER_SIZE:
+        if any_sysex:
+            # A SysEx transfer owns the stream: drain its track
+            # exclusively until EOX, bypassing the heap.
+            tm = tracks[sysex_idx]
+            if not tm.abs_buffer or tm.this_event >= tm._fill:
+                break
+            candidate = tm.abs_buffer[tm.this_event]
+            candidate_track = tm
+            candidate_idx = sysex_idx
+        else:
+            if not heap:
+                break
+            head_time, i = heapq.heappop(heap)
+            tm = tracks[i]
+            if not tm.abs_buffer or tm.this_event >= tm._fill:
                 continue
-            ev = tm.abs_buffer[tm.this_event]
-            if candidate is None or ev.time < candidate.time:
-                if not any_sysex or tm is sysex_track:
-                    candidate = ev
-                    candidate_track = tm
-
-        if candidate is None:
-            break
+            if times[i][tm.this_event] != head_time:
+                # Head advanced while this entry sat in the heap
+                # (SysEx drain); reinsert the live head and retry.
+                heapq.heappush(heap, (times[i][tm.this_event], i))
+                continue
+            candidate = tm.abs_buffer[tm.this_event]
+            candidate_track = tm
+            candidate_idx = i
 
-        merged.append(candidate)
+        # Copy into the pooled output buffer (struct assignment copies
+        # by value, so later delta rewrites don't alias track buffers).
+        storage[n_merged] = candidate
+        merged_times.append(times[candidate_idx][candidate_track.this_event])
+        n_merged += 1
         candidate_track.this_event += 1
 
         if candidate.data1 == SYSEX:
             candidate_track.in_sysex = 1
             any_sysex = True
             sysex_track = candidate_track
+            sysex_idx = candidate_idx
         elif candidate.data1 == EOX:
             candidate_track.in_sysex = 0
             any_sysex = False
             sysex_track = None
+            sysex_idx = -1
+
+        # Push the consumed track's next head (the drain branch handles
+        # its own cursor, so only re-arm the heap outside SysEx mode).
+        if not any_sysex and candidate_track.this_event < candidate_track._fill:
+            heapq.heappush(
+                heap,
+                (times[candidate_idx][candidate_track.this_event], candidate_idx),
+            )
 
     # Update track positions
     for tm in tracks:
         tm.last_event += tm.this_event
 
-    # Convert absolute → delta time
-    if merged:
-        new_last_abs = merged[-1].time
-        for i in range(len(merged) - 1, 0, -1):
-            merged[i].time -= merged[i - 1].time
-            if merged[i].time < 0:
-                merged[i].time = 0
-        merged[0].time -= state.last_abs
-        state.last_abs = new_last_abs
-
-    # Assign merge buffer back to state
-    merge_type = MidiEvent * len(merged)
-    state.merge_buffer = merge_type(*merged)
-    state.merge_size = len(merged)
+    # Convert absolute → delta time: one forward pass over the plain-int
+    # times gathered during the merge, a single ctypes field write per
+    # event (the old reverse loop cost two field reads plus a write, all
+    # through the struct descriptor). No sign check needed — times are
+    # uint32 and the heap merge guarantees they are monotonic.
+    if n_merged:
+        prev = state.last_abs
+        for i, t in enumerate(merged_times):
+            storage[i].time = t - prev
+            prev = t
+        state.last_abs = prev
+
+    # The merge buffer already points at the pooled storage; just
+    # publish the live prefix.
+    state.merge_buffer = storage
+    state.merge_size = n_merged
     state.out_ptr = 0
-    return merged
+    return storage[:n_merged]
 
 # ---------------------------------------------------------------------------
 # Output pumping
@@ -163,6 +265,17 @@ def merge_out(state: CMaxMidiOutState, put_func):
         return
     if state.out_ptr >= state.merge_size:
         merge_tracks(state)
+
+    # Bulk fast path: a MidiOut (or anything exposing send_bulk) takes
+    # the whole pending slice in one call — one driver crossing instead
+    # of one per event.
+    send_bulk = getattr(put_func, "send_bulk", None)
+    if send_bulk is not None:
+        if state.out_ptr < state.merge_size:
+            send_bulk(state.merge_buffer, state.out_ptr, state.merge_size)
+            state.out_ptr = state.merge_size
+        return
+
     while state.out_ptr < state.merge_size:
         ev = state.merge_buffer[state.out_ptr]
         if not put_func(ev):
@@ -172,7 +285,70 @@ def merge_out(state: CMaxMidiOutState, put_func):
 # ---------------------------------------------------------------------------
 # Example MIDI output stub
 # ---------------------------------------------------------------------------
+
+# Compiled wire format and a reusable send buffer: packing an event is
+# one pack_into call, no string_at/bytes() double copy and no sizeof()
+# lookup per event.
+_EVENT_STRUCT = struct.Struct("<IBBB")
+_SEND_BUF = bytearray(_EVENT_STRUCT.size)
+
+
 def put_midi_out(event: MidiEvent) -> bool:
-    # Here you'd call ctypes-wrapped library function
-    raw_bytes = bytes(ctypes.string_at(ctypes.byref(event), ctypes.sizeof(event)))
-    return True
\ No newline at end of file
+    # Here you'd hand _SEND_BUF to the ctypes-wrapped library function
+    _EVENT_STRUCT.pack_into(
+        _SEND_BUF, 0, event.time, event.status, event.data1, event.data2
+    )
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Output port
+# ---------------------------------------------------------------------------
+class MidiOut:
+    """
+    MIDI output port.
+
+    send() writes a single message; send_bulk() hands a contiguous slice
+    of a packed MidiEvent buffer to the driver in one call — the
+    platform event-list APIs (MIDIReceiveEventList, midiStreamOut)
+    accept many events per submission, so batching cuts the per-event
+    user/kernel crossings.
+    """
+
+    def __init__(self):
+        self.state = CMaxMidiOutState()
+        self.is_open = False
+
+    def open(self, port=0):
+        self.state.device_id = port
+        self.state.is_open = 1
+        self.is_open = True
+
+    def open_default(self):
+        self.open(0)
+
+    def close(self):
+        self.state.is_open = 0
+        self.is_open = False
+
+    def send(self, status, data1=0, data2=0):
+        put_midi_out(MidiEvent(0, status, data1, data2))
+
+    def send_bulk(self, buffer, start, end):
+        """
+        Write events buffer[start:end] to the driver in one call.
+        buffer is a MidiEvent ctypes array; returns the event count.
+        """
+        n = end - start
+        if n <= 0:
+            return 0
+        blob = ctypes.string_at(
+            ctypes.addressof(buffer) + start * EVENT_SIZE, n * EVENT_SIZE
+        )
+        self._write_bulk(blob)
+        return n
+
+    def _write_bulk(self, blob: bytes):
+        # Here you'd hand the packed event list to the ctypes-wrapped
+        # driver API in one call.
+        pass
\ No newline at end of file
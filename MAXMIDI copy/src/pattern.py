@@ -10,6 +10,8 @@ Includes:
 import time
 from typing import List, Iterable
 
+from .message_batch import note_off_batch, note_on_batch
+
 
 # -------------------------------------------------
 # Base Pattern
@@ -18,16 +20,46 @@ from typing import List, Iterable
 class Pattern:
     """
     Base pattern class.
+
+    Subclasses implement ``_compile``, which flattens the pattern into
+    (status, d1, d2, wait_after) rows with all clamping done up front.
+    The schedule is cached per velocity, so replaying a pattern is one
+    tight loop of sends and sleeps — no per-step message building.
     """
 
     def __init__(self, steps: Iterable, step_time: float = 0.25):
         self.steps = list(steps)
         self.step_time = float(step_time)
+        self._schedule = None
+        self._schedule_key = None
+
+    def _compile(self, velocity):
+        raise NotImplementedError
+
+    def _play_schedule(self, midi, velocity):
+        key = (velocity, self.step_time)
+        if key != self._schedule_key:
+            self._schedule = self._compile(velocity)
+            self._schedule_key = key
+
+        send = midi.send
+        sleep = midi.sleep
+        for status, d1, d2, wait in self._schedule:
+            if status:
+                send(status, d1, d2)
+            if wait:
+                sleep(wait)
 
     def play(self, midi, velocity=100):
         raise NotImplementedError
 
 
+def _c7(value):
+    """Clamp to 0-127 once, at compile time."""
+    v = int(value)
+    return 0 if v < 0 else (127 if v > 127 else v)
+
+
 # -------------------------------------------------
 # Note Pattern
 # -------------------------------------------------
@@ -39,13 +71,20 @@ class NotePattern(Pattern):
     steps: list of MIDI notes or None (rest)
     """
 
-    def play(self, midi, velocity=100):
+    def _compile(self, velocity):
+        vel = _c7(velocity)
+        rows = []
         for note in self.steps:
-            if note is not None:
-                midi.note_on(note, velocity)
-            midi.sleep(self.step_time)
-            if note is not None:
-                midi.note_off(note)
+            if note is None:
+                rows.append((0, 0, 0, self.step_time))
+            else:
+                n = _c7(note)
+                rows.append((0x90, n, vel, self.step_time))
+                rows.append((0x80, n, 0, 0.0))
+        return rows
+
+    def play(self, midi, velocity=100):
+        self._play_schedule(midi, velocity)
 
 
 # -------------------------------------------------
@@ -61,19 +100,38 @@ class DrumPattern(Pattern):
 
     DRUM_CHANNEL = 9
 
-    def play(self, midi, velocity=100):
+    def __init__(self, steps: Iterable, step_time: float = 0.25):
+        super().__init__(steps, step_time)
+        # Normalize once: every step is a tuple of notes, so compiling
+        # (or replaying) never isinstance-checks or wraps per step.
+        self.steps = [
+            tuple(s) if isinstance(s, (list, tuple)) else (s,)
+            for s in self.steps
+        ]
+
+    def _compile(self, velocity):
+        vel = _c7(velocity)
+        on = 0x90 | self.DRUM_CHANNEL
+        off = 0x80 | self.DRUM_CHANNEL
+        rows = []
         for step in self.steps:
-            notes = step if isinstance(step, (list, tuple)) else [step]
+            notes = [_c7(n) for n in step if n is not None]
 
-            for note in notes:
-                if note is not None:
-                    midi.note_on(note, velocity, channel=self.DRUM_CHANNEL)
+            if not notes:
+                rows.append((0, 0, 0, self.step_time))
+                continue
 
-            midi.sleep(self.step_time)
+            # The step's wait rides on the last note-on, putting it
+            # between the ons and the offs.
+            for n in notes[:-1]:
+                rows.append((on, n, vel, 0.0))
+            rows.append((on, notes[-1], vel, self.step_time))
+            for n in notes:
+                rows.append((off, n, 0, 0.0))
+        return rows
 
-            for note in notes:
-                if note is not None:
-                    midi.note_off(note, channel=self.DRUM_CHANNEL)
+    def play(self, midi, velocity=100):
+        self._play_schedule(midi, velocity)
 
 
 # -------------------------------------------------
@@ -107,10 +165,17 @@ class Arpeggiator:
         return self.notes
 
     def play(self, midi, velocity=100):
-        for note in self._order():
-            midi.note_on(note, velocity)
+        # Pack all messages up front; the loop only indexes frames and
+        # sleeps — no per-note message building.
+        order = self._order()
+        ons = note_on_batch(order, velocity)
+        offs = note_off_batch(order)
+
+        send = midi.send
+        for i in range(0, 3 * len(order), 3):
+            send(ons[i], ons[i + 1], ons[i + 2])
             midi.sleep(self.step_time)
-            midi.note_off(note)
+            send(offs[i], offs[i + 1], offs[i + 2])
 
 
 # -------------------------------------------------
@@ -4,54 +4,95 @@ MIDI port discovery and helpers.
 This module provides a simple, stable API for:
 - listing MIDI input/output ports
 - opening ports by index or name
+
+Enumeration results are cached for a short TTL: device enumeration is
+syscall-heavy on CoreMIDI/ALSA, and applications that reconnect to a
+named port repeatedly would otherwise pay it on every open. Call
+refresh_ports() to force a rescan (e.g. after plugging in a device).
 """
 
-from .in import MidiIn
+import importlib
+import time
+
+# `in` is a Python keyword, so the module can't be named in a plain
+# import statement.
+MidiIn = importlib.import_module(".in", __package__).MidiIn
 from .out import MidiOut
 
 
 # -------------------------------------------------
-# Port listing
+# Enumeration cache
 # -------------------------------------------------
 
-def list_inputs():
-    """
-    Return a list of available MIDI input port names.
-    """
-    ports = []
-    midi = MidiIn()
+PORT_CACHE_TTL = 1.0  # seconds
+
+_port_cache = {}  # "in" / "out" -> (monotonic timestamp, names)
 
+
+def refresh_ports():
+    """Drop cached port lists; the next listing re-enumerates."""
+    _port_cache.clear()
+
+
+def _scan(midi):
+    """Enumerate port names on an instance, closing it afterwards."""
     try:
-        count = midi.get_port_count()
-        for i in range(count):
-            ports.append(midi.get_port_name(i))
+        return [midi.get_port_name(i) for i in range(midi.get_port_count())]
     finally:
         midi.close()
 
-    return ports
 
+def _cached_ports(kind, factory):
+    now = time.monotonic()
+    hit = _port_cache.get(kind)
+    if hit is not None and now - hit[0] < PORT_CACHE_TTL:
+        return hit[1]
+    names = _scan(factory())
+    _port_cache[kind] = (now, names)
+    return names
 
-def list_outputs():
+
+# -------------------------------------------------
+# Port listing
+# -------------------------------------------------
+
+def list_inputs():
     """
-    Return a list of available MIDI output port names.
+    Return a list of available MIDI input port names.
     """
-    ports = []
-    midi = MidiOut()
+    return list(_cached_ports("in", MidiIn))
 
-    try:
-        count = midi.get_port_count()
-        for i in range(count):
-            ports.append(midi.get_port_name(i))
-    finally:
-        midi.close()
 
-    return ports
+def list_outputs():
+    """
+    Return a list of available MIDI output port names.
+    """
+    return list(_cached_ports("out", MidiOut))
 
 
 # -------------------------------------------------
 # Port open helpers
 # -------------------------------------------------
 
+def _open_by_name(midi, kind, port):
+    hit = _port_cache.get(kind)
+    if hit is not None and time.monotonic() - hit[0] < PORT_CACHE_TTL:
+        names = hit[1]
+        if port in names:
+            midi.open(names.index(port))
+            return midi
+    else:
+        # Single pass on the instance we already have: stop at the first
+        # match instead of building the full list and re-searching it.
+        for i in range(midi.get_port_count()):
+            if midi.get_port_name(i) == port:
+                midi.open(i)
+                return midi
+
+    midi.close()
+    raise ValueError(f"MIDI {kind}put port not found: {port}")
+
+
 def open_input(port):
     """
     Open an input port by index or name.
@@ -62,12 +103,7 @@ def open_input(port):
         midi.open(port)
         return midi
 
-    ports = list_inputs()
-    if port not in ports:
-        raise ValueError(f"MIDI input port not found: {port}")
-
-    midi.open(ports.index(port))
-    return midi
+    return _open_by_name(midi, "in", port)
 
 
 def open_output(port):
@@ -80,9 +116,4 @@ def open_output(port):
         midi.open(port)
         return midi
 
-    ports = list_outputs()
-    if port not in ports:
-        raise ValueError(f"MIDI output port not found: {port}")
-
-    midi.open(ports.index(port))
-    return midi
\ No newline at end of file
+    return _open_by_name(midi, "out", port)
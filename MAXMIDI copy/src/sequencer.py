@@ -31,6 +31,7 @@ class Sequencer:
         self.bars = bars
         self.total_steps = steps_per_bar * bars
         self.events: List[tuple[int, Playable, float]] = []  # (step, item, duration_in_beats)
+        self._sorted = True  # events kept sorted lazily; at() clears this
         self.humanize_time: float = 0.0
         self.humanize_vel: int = 0
 
@@ -70,6 +71,7 @@ class Sequencer:
         if step < 0 or step >= self.total_steps:
             raise ValueError(f"Step {step} out of bounds (0–{self.total_steps-1})")
         self.events.append((step, item, duration))
+        self._sorted = False
         return self
 
     def rest(self, beats: float = 1.0) -> "Sequencer":
@@ -89,41 +91,67 @@ class Sequencer:
 
     def play(self, loop: int = 1):
         """Play the sequence"""
-        for _ in range(loop):
-            played_steps = set()
-
-            for step, item, duration in sorted(self.events, key=lambda e: e[0]):
-                if item is None:  # Rest
-                    continue
-
-                # Wait until this step
-                wait_steps = step - min(played_steps or {0})
-                time.sleep(wait_steps * self.step_duration)
-
-                # Humanization
-                offset = 0.0
-                vel_adjust = 0
-                if self.humanize_time:
-                    offset = random.uniform(-self.humanize_time, self.humanize_time)
-                if self.humanize_vel and hasattr(item, "velocity"):
-                    # Apply to chords/arps/notes that support velocity
-                    original_vel = getattr(item, "velocity", 100)
-                    vel_adjust = random.randint(-self.humanize_vel, self.humanize_vel)
-                    item.velocity(original_vel + vel_adjust)
-
-                time.sleep(max(0, offset))  # Apply time offset
-
-                # Play the item (with its own duration handling if needed)
-                if hasattr(item, "play"):
-                    # For Arpeggiator, DrumPattern, etc.
-                    item.play(duration=duration * self.beat_duration)
-                elif isinstance(item, (Chord, Note)):
-                    item.play(duration=duration * self.beat_duration)
-
-                played_steps.add(step)
-
-            # End of loop rest
-            time.sleep(self.total_steps * self.step_duration)
+        # Hoist the per-access property math out of the loop.
+        step_duration = self.step_duration
+        beat_duration = self.beat_duration
+        loop_duration = self.total_steps * step_duration
+
+        # Compile once: every pass of every loop becomes an absolute
+        # offset from a single start time. Playback then sleeps to
+        # deadlines instead of chaining relative sleeps, so OS wakeup
+        # jitter doesn't accumulate into drift across passes.
+        # Sort in place at most once per edit: at() marks the list dirty,
+        # so repeated play() calls skip the O(E log E) sort entirely.
+        if not self._sorted:
+            self.events.sort(key=lambda e: e[0])
+            self._sorted = True
+        schedule = [
+            (pass_idx * loop_duration + step * step_duration, item, duration)
+            for pass_idx in range(loop)
+            for step, item, duration in self.events
+            if item is not None
+        ]
+
+        # Batch the RNG draws: one list comprehension per knob before the
+        # loop, indexed by event counter, instead of a random call (with
+        # its bound-method and argument overhead) inside every iteration.
+        humanize_time = self.humanize_time
+        humanize_vel = self.humanize_vel
+        n = len(schedule)
+        t_off = None
+        v_off = None
+        if humanize_time:
+            uniform = random.uniform
+            t_off = [uniform(-humanize_time, humanize_time) for _ in range(n)]
+        if humanize_vel:
+            randint = random.randint
+            v_off = [randint(-humanize_vel, humanize_vel) for _ in range(n)]
+
+        perf = time.perf_counter
+        start = perf()
+
+        for i, (at, item, duration) in enumerate(schedule):
+            deadline = start + at
+            if t_off is not None:
+                deadline += t_off[i]
+            delay = deadline - perf()
+            if delay > 0:
+                time.sleep(delay)
+
+            if v_off is not None and hasattr(item, "velocity"):
+                # Apply to chords/arps/notes that support velocity
+                original_vel = getattr(item, "velocity", 100)
+                item.velocity(original_vel + v_off[i])
+
+            # Play the item (with its own duration handling if needed)
+            if hasattr(item, "play") or isinstance(item, (Chord, Note)):
+                item.play(duration=duration * beat_duration)
+
+        # Tail rest to the exact end of the last pass, so chained
+        # sequences stay on the grid.
+        delay = start + loop * loop_duration - perf()
+        if delay > 0:
+            time.sleep(delay)
 
     # Presets / helpers
     @classmethod
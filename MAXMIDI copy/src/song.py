@@ -2,9 +2,12 @@
 # src/song.py
 
 from typing import Union, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from mido import MidiFile, MidiTrack, Message, MetaMessage
+import heapq
+import random
 import time
-import threading
 from .sequencer import Sequencer
 from .drums import DrumPattern
 from .chord import Chord
@@ -13,6 +16,77 @@ from .humanize import humanize  # If using the separate humanize module
 
 Playable = Union[Sequencer, DrumPattern, Chord, Arpeggiator]
 
+
+def _is_empty(item) -> bool:
+    """True when a playable has nothing to emit (empty sequencer rows,
+    drum patterns with no hits, chords with no notes)."""
+    if isinstance(item, (Sequencer, DrumPattern)):
+        return not getattr(item, "events", None)
+    if isinstance(item, Chord):
+        return not getattr(item, "notes", None)
+    return False
+
+
+# Below this many tracks the collection work is too small to amortize
+# worker startup and pickling; save() stays serial.
+PARALLEL_SAVE_MIN_TRACKS = 4
+
+
+def _collect_track_events(track, ticks_per_quarter):
+    """Collect one track's (onset_tick, off_tick, note, vel) rows.
+
+    Top-level (picklable) so save() can fan tracks out to a process
+    pool: each track's collection is independent of the others.
+    """
+    item = track["playable"]
+    if _is_empty(item):
+        return []
+
+    events = []
+
+    if isinstance(item, Chord):
+        duration_beats = 1.0
+        dur_ticks = int(duration_beats * ticks_per_quarter)
+        for note in item.notes:
+            events.append((0, dur_ticks, note.pitch, item.velocity or 100))
+    elif isinstance(item, Arpeggiator):
+        # Simplified: export as sequential notes, one batch
+        arp_notes = item.generate_pattern()  # You may need to expose this
+        step_ticks = ticks_per_quarter // 4
+        events = [
+            (i * step_ticks, (i + 1) * step_ticks, note, 90)
+            for i, note in enumerate(arp_notes)
+        ]
+    elif isinstance(item, DrumPattern):
+        # Steps can be fractional (on(2.5) places an off-grid hit), so
+        # the tick math must round back to int — mido rejects float
+        # delta times.
+        step_ticks = ticks_per_quarter // 4
+        events = [
+            (int(step * step_ticks), int((step + 1) * step_ticks), note_num, vel)
+            for step, note_num, vel in item.events
+        ]
+    elif isinstance(item, Sequencer):
+        # Extract events from sequencer
+        step_ticks = ticks_per_quarter * 4 // item.steps_per_bar
+        for step, playable, duration in item.events:
+            if playable is None:
+                continue
+            tick_start = step * step_ticks
+            dur_ticks = int(duration * ticks_per_quarter)
+            if isinstance(playable, Chord):
+                for n in playable.notes:
+                    events.append((tick_start, tick_start + dur_ticks, n.pitch, 100))
+            # Add more types as needed
+
+    # Rows come back in builder order, which need not be onset order:
+    # Sequencer.at() inserts anywhere, and DrumPattern appends per
+    # instrument (all kicks, then all snares, ...). save() merges the
+    # on/off streams on the promise that this list is onset-sorted.
+    events.sort()
+    return events
+
+
 class Song:
     """
     A multi-track song composer and player.
@@ -69,55 +143,129 @@ class Song:
 
         return max_duration or (4 * 4 * beat_duration)  # Default 4 bars
 
+    def _schedule(self, loop: int = 1):
+        """
+        Merge every track's events into one heap keyed by absolute time.
+
+        Sequencer and DrumPattern tracks are decomposed into their
+        individual timed events, so no single play() call can block the
+        scheduler for a whole pattern and tracks genuinely interleave.
+        Humanization offsets are drawn here, per event, because the
+        decomposed items never run their own play() loops (which is
+        where they would normally apply them). Entries are
+        (abs_seconds, n, fire, kwargs) with n as a tie-break so equal
+        deadlines never compare callables.
+        """
+        heap = []
+        n = 0
+        beat_duration = 60.0 / self.bpm
+        uniform = random.uniform
+        randint = random.randint
+
+        for track in self.tracks:
+            item = track["playable"]
+            channel = track["channel"]
+            # Muted or empty tracks schedule nothing at all.
+            if getattr(item, "muted", False) or _is_empty(item):
+                continue
+            ht = getattr(item, "humanize_time", 0.0)
+            hv = getattr(item, "humanize_vel", 0)
+            if isinstance(item, Sequencer):
+                step_duration = item.step_duration
+                loop_duration = item.total_steps * step_duration
+                for pass_idx in range(loop):
+                    base = pass_idx * loop_duration
+                    for step, playable, duration in item.events:
+                        play = getattr(playable, "play", None)
+                        if play is None:
+                            continue
+                        when = base + step * step_duration
+                        if ht:
+                            when = max(0.0, when + uniform(-ht, ht))
+                        kwargs = {"duration": duration * beat_duration}
+                        if hasattr(playable, "channel"):
+                            kwargs["channel"] = channel
+                        heap.append((when, n, play, kwargs))
+                        n += 1
+            elif isinstance(item, DrumPattern):
+                step_duration = (60.0 / item.bpm) / (item.steps // 4)
+                bar_duration = item.steps * step_duration
+                for pass_idx in range(loop):
+                    base = pass_idx * bar_duration
+                    for step, note_num, vel in item.events:
+                        when = base + step * step_duration
+                        if ht:
+                            when = max(0.0, when + uniform(-ht, ht))
+                        if hv:
+                            vel = max(1, min(127, vel + randint(-hv, hv)))
+                        heap.append((when, n, item.hit, {
+                            "note": note_num,
+                            "velocity": vel,
+                            "channel": channel,
+                        }))
+                        n += 1
+            else:
+                play = getattr(item, "play", None)
+                if play is None:
+                    continue
+                kwargs = {"loop": loop}
+                if hasattr(item, "channel"):
+                    kwargs["channel"] = channel
+                heap.append((0.0, n, play, kwargs))
+                n += 1
+
+        heapq.heapify(heap)
+        return heap
+
     def play(self, loop: int = 1):
-        """Play all tracks simultaneously in separate threads"""
+        """Play all tracks from a single scheduler loop"""
         if not self.tracks:
             print("Warning: Song has no tracks to play.")
             return
 
-        def play_track(track_dict):
-            item = track_dict["playable"]
-            channel = track_dict["channel"]
-
-            # Apply song-level humanization
-            if self.humanize_time or self.humanize_vel:
-                if hasattr(item, "humanize"):
-                    item.humanize(time=self.humanize_time, velocity=self.humanize_vel)
-
-            # Temporary channel override if needed
-            original_channel = None
-            if hasattr(item, "channel"):
-                original_channel = item.channel
-                item.channel = channel
-
-            try:
-                if hasattr(item, "play"):
-                    item.play(loop=loop)
-            finally:
-                if original_channel is not None:
-                    item.channel = original_channel
-
-        # Start all tracks at the same time
-        threads = []
+        # Apply song-level humanization once, up front, instead of per
+        # playback thread. The zero test is hoisted out of the loop:
+        # with both deltas zero no track pays even the hasattr dispatch.
+        apply_humanize = bool(self.humanize_time or self.humanize_vel)
         for track in self.tracks:
-            t = threading.Thread(target=play_track, args=(track,))
-            t.start()
-            threads.append(t)
+            item = track["playable"]
+            if apply_humanize and hasattr(item, "humanize"):
+                item.humanize(time=self.humanize_time, velocity=self.humanize_vel)
+
+        # Single scheduler: one heap of absolute deadlines computed from
+        # a single start time. One thread means no GIL thrash between
+        # per-track threads, and deadlines don't drift the way chained
+        # per-thread sleeps do.
+        heap = self._schedule(loop)
+        start = time.monotonic()
 
-        # Wait for all to finish
-        for t in threads:
-            t.join()
+        # Each entry fires one short event; the track channel rides the
+        # entry kwargs (decided at schedule time) — no mutate-and-restore
+        # of item.channel, which raced when two tracks shared one
+        # playable instance.
+        while heap:
+            target, _, fire, kwargs = heapq.heappop(heap)
+            dt = start + target - time.monotonic()
+            if dt > 0:
+                time.sleep(dt)
+            fire(**kwargs)
 
     def save(self, filename: str = "song.mid"):
         """Export the song to a Standard MIDI File"""
         mid = MidiFile(ticks_per_beat=480)  # Standard resolution
         midi_tracks = {}
 
+        # One tempo event on a conductor track (SMF convention), not a
+        # copy per channel — duplicate set_tempo messages at tick 0 are
+        # redundant validator work and ambiguous to readers.
+        conductor = MidiTrack()
+        conductor.append(MetaMessage('set_tempo', tempo=int(60000000 / self.bpm)))
+        mid.tracks.append(conductor)
+
         # Initialize a MIDI track for each channel used
         used_channels = {t["channel"] for t in self.tracks}
         for ch in used_channels:
             mtrack = MidiTrack()
-            mtrack.append(MetaMessage('set_tempo', tempo=int(60000000 / self.bpm)))
             if ch == 9:
                 mtrack.append(Message('program_change', channel=ch, program=0, time=0))  # Drum channel
             midi_tracks[ch] = mtrack
@@ -132,53 +280,58 @@ class Song:
                 mtrack.append(Message('note_off', note=note, velocity=0, channel=mtrack_channel, time=current_tick))
                 current_tick = 0
 
-        # Collect events from each playable
+        # Collect events from each playable. Collection is independent
+        # per track, so big songs fan it out to worker processes
+        # (threads wouldn't help here: the loop is pure Python under
+        # the GIL); the mido track assembly stays in this process.
         ticks_per_quarter = 480
-        for track in self.tracks:
-            item = track["playable"]
+        if len(self.tracks) >= PARALLEL_SAVE_MIN_TRACKS:
+            with ProcessPoolExecutor() as ex:
+                per_track_events = list(
+                    ex.map(_collect_track_events, self.tracks,
+                           repeat(ticks_per_quarter))
+                )
+        else:
+            per_track_events = [
+                _collect_track_events(track, ticks_per_quarter)
+                for track in self.tracks
+            ]
+
+        for track, events in zip(self.tracks, per_track_events):
+            if not events:
+                continue
             mtrack_channel = track["channel"]
             mtrack = midi_tracks[mtrack_channel]
 
-            events = []  # List of (type, note, vel, duration_ticks)
-
-            if isinstance(item, Chord):
-                duration_beats = 1.0
-                for note in item.notes:
-                    events.append(('note_on', note.pitch, item.velocity or 100, int(duration_beats * ticks_per_quarter)))
-            elif isinstance(item, Arpeggiator):
-                # Simplified: export as sequential notes
-                arp_notes = item.generate_pattern()  # You may need to expose this
-                step_ticks = ticks_per_quarter // 4
-                for note in arp_notes:
-                    events.append(('note_on', note, 90, step_ticks))
-            elif isinstance(item, DrumPattern):
-                step_ticks = ticks_per_quarter // 4
-                for step, note_num, vel in item.events:
-                    tick_offset = step * step_ticks
-                    events.append(('note_on', note_num, vel, step_ticks))
-            elif isinstance(item, Sequencer):
-                # Extract events from sequencer
-                step_ticks = ticks_per_quarter * 4 // item.steps_per_bar
-                for step, playable, duration in item.events:
-                    if playable is None:
-                        continue
-                    tick_start = step * step_ticks
-                    dur_ticks = int(duration * ticks_per_quarter)
-                    if isinstance(playable, Chord):
-                        for n in playable.notes:
-                            events.append(('note_on', n.pitch, 100, dur_ticks))
-                    # Add more types as needed
-
-            # Sort by time and add to track
-            # For simplicity, assuming sequential for now
-            current_time = 0
-            for ev in sorted(events, key=lambda x: x[3]):  # Rough sorting
-                msg = Message(ev[0], note=ev[1], velocity=ev[2], channel=mtrack_channel, time=current_time)
-                mtrack.append(msg)
-                current_time = ev[3]
-                off = Message('note_off', note=ev[1], velocity=0, channel=mtrack_channel, time=current_time)
-                mtrack.append(off)
-                current_time = 0
+            # One fully validated prototype per message kind; the emit
+            # loop then uses copy(), which skips mido's kwarg validation
+            # for the fields that don't change (type, channel).
+            proto_on = Message('note_on', channel=mtrack_channel,
+                               note=0, velocity=0, time=0)
+            proto_off = Message('note_off', channel=mtrack_channel,
+                                note=0, velocity=0, time=0)
+
+            # The note-on stream is already in onset order and the
+            # note-off stream is nearly so (one timsort pass away), so
+            # interleave the two sorted runs with heapq.merge instead of
+            # re-sorting the combined timeline. At equal ticks offs sort
+            # first (flag 0 < 1), so repeated notes don't stick. The
+            # emit below converts to running deltas — mido Message.time
+            # is a delta, not an absolute.
+            ons = [(onset, 1, 'note_on', note, vel)
+                   for onset, off, note, vel in events]
+            offs = sorted((off, 0, 'note_off', note, 0)
+                          for onset, off, note, vel in events)
+            timeline = list(heapq.merge(ons, offs))
+            ticks = [row[0] for row in timeline]
+            deltas = [t - p for t, p in zip(ticks, [0] + ticks[:-1])]
+            # Build every Message in one comprehension and extend the
+            # track once — no per-message append bookkeeping.
+            mtrack.extend(
+                (proto_on if is_on else proto_off).copy(
+                    note=note, velocity=vel, time=delta)
+                for (_, is_on, _, note, vel), delta in zip(timeline, deltas)
+            )
 
         mid.save(filename)
         print(f"Song saved as '{filename}'")
@@ -21,6 +21,7 @@ import ctypes
 MXMIDIERR_MAXERR = 0
 USE_CURRENT = 0xFFFF
 S_INT = 0x0001  # internal sync mode
+MICROSECONDS_PER_MINUTE = 60000000.0
 
 # ------------------------------------------------------------
 # Mock low-level Sync API (C-style stubs)
@@ -68,9 +69,19 @@ class CMaxMidiSyncStruct(ctypes.Structure):
     ]
 
 class CMaxMidiSync:
+    def _reset_state(self):
+        # Zero the existing struct in place instead of instantiating a
+        # fresh CMaxMidiSyncStruct on every failure path — sync opens
+        # sit in hot retry loops and the ctypes constructor isn't free.
+        ctypes.memset(ctypes.byref(self._state), 0, ctypes.sizeof(self._state))
+
     def __init__(self, parent_wnd=None, mode=None, timer_period=None):
         self.hParentWnd = parent_wnd
         self.m_hWnd = id(self)
+        # Last Convert() argument and result. Sync callbacks convert
+        # the same tempo thousands of times a second; a hit is one
+        # compare instead of a float divide.
+        self._tempo_cache = (None, None)
         self._state = CMaxMidiSyncStruct(
             hDevice=0,
             fIsOpen=False,
@@ -114,13 +125,13 @@ class CMaxMidiSync:
                 self._state.current_period = timer_period
                 return True
 
-        self._state = CMaxMidiSyncStruct()
+        self._reset_state()
         return False
 
     def Close(self):
         if self._state.fIsOpen:
             CloseSync(self._state.hDevice)
-        self._state = CMaxMidiSyncStruct()
+        self._reset_state()
 
     # --------------------------------------------------------
     # Mode / Period
@@ -132,7 +143,7 @@ class CMaxMidiSync:
                 self._state.hDevice = hDevice
                 self._state.current_mode = mode
                 return True
-        self._state = CMaxMidiSyncStruct()
+        self._reset_state()
         return False
 
     def SetPeriod(self, period):
@@ -142,7 +153,7 @@ class CMaxMidiSync:
                 self._state.hDevice = hDevice
                 self._state.current_period = period
                 return True
-        self._state = CMaxMidiSyncStruct()
+        self._reset_state()
         return False
 
     # --------------------------------------------------------
@@ -187,11 +198,17 @@ class CMaxMidiSync:
     # Tempo Conversion
     # --------------------------------------------------------
     def Convert(self, value):
+        # type check too: 120 == 120.0 but the int and float branches
+        # return different result types.
+        last_v, last_r = self._tempo_cache
+        if value == last_v and type(value) is type(last_v):
+            return last_r
         if isinstance(value, float):
-            if value == 0.0:
-                value = 120.0
-            return int(60000000.0 / value)
-        return 60000000.0 / float(value)
+            result = int(MICROSECONDS_PER_MINUTE / (value or 120.0))
+        else:
+            result = MICROSECONDS_PER_MINUTE / float(value)
+        self._tempo_cache = (value, result)
+        return result
 
     # --------------------------------------------------------
     # Overridable hooks
@@ -11,6 +11,8 @@
 # ---------------------------------------------------------------------------
 
 import ctypes
+from bisect import bisect_right
+from itertools import accumulate
 
 # ------------------------------------------------------------
 # Constants
@@ -32,6 +34,11 @@ class MidiEvent(ctypes.Structure):
     def __init__(self, time=0, status=0, data1=0, data2=0):
         super().__init__(time, status, data1, data2)
 
+
+# Computed once; ctypes.sizeof walks the type tables on every call, so
+# the shift/grow paths use this constant instead.
+EVENT_SIZE = ctypes.sizeof(MidiEvent)
+
 # ------------------------------------------------------------
 # CMaxMidiTrack struct-backed class
 # ------------------------------------------------------------
@@ -49,8 +56,18 @@ class CMaxMidiTrack:
         self.pMidiOut = None
         self.pMidiIn = None
 
-        # Allocate buffer array
+        # Allocate buffer array, plus a flat uint32 view over it (all
+        # four MidiEvent fields are uint32). Scalar time reads/writes go
+        # through the view as plain C-int indexing — about an order of
+        # magnitude cheaper than marshalling a Structure per access —
+        # while the packed layout stays memmove-compatible.
         self.lpBuffer = (MidiEvent * self.dwBufSize)()
+        self._flat = (ctypes.c_uint32 * (4 * self.dwBufSize)).from_buffer(self.lpBuffer)
+
+        # Lazily built cumulative-time column; any edit that touches
+        # delta times drops it. Keeps AbsNow O(1) after one O(n) build
+        # instead of re-summing deltas per call.
+        self._abs_cache = None
 
     # --------------------------------------------------------
     # Destructor-style cleanup
@@ -98,10 +115,14 @@ class CMaxMidiTrack:
     # Buffer management
     # --------------------------------------------------------
     def FreeBuffer(self):
-        self.lpBuffer = (MidiEvent * 0)()
+        # No zero-length ctypes array just to discard; _grow reallocates
+        # on the next insert.
+        self.lpBuffer = None
+        self._flat = None
         self.dwBufSize = 0
         self.inPtr = 0
         self.outPtr = 0
+        self._abs_cache = None
 
     def GetBufferSize(self):
         return self.dwBufSize
@@ -111,6 +132,15 @@ class CMaxMidiTrack:
 
     def Flush(self):
         self.inPtr = self.outPtr = 0
+        self._abs_cache = None
+        # A long recording can leave the buffer at its peak _grow size;
+        # nothing live survives a flush, so fall back to the default
+        # allocation instead of holding peak memory for the rest of the
+        # session.
+        if self.dwBufSize > DEFAULT_BUFFER_SIZE:
+            self.lpBuffer = (MidiEvent * DEFAULT_BUFFER_SIZE)()
+            self.dwBufSize = DEFAULT_BUFFER_SIZE
+            self._flat = (ctypes.c_uint32 * (4 * DEFAULT_BUFFER_SIZE)).from_buffer(self.lpBuffer)
 
     def Rewind(self):
         self.outPtr = 0
@@ -126,11 +156,12 @@ class CMaxMidiTrack:
     def SetEvent(self, event, eventNum):
         if eventNum < self.dwBufSize:
             self.lpBuffer[eventNum] = event
+            self._abs_cache = None
 
     def GetTime(self, eventNum):
         if eventNum >= self.inPtr:
             return 0
-        return self.lpBuffer[eventNum].time
+        return self._flat[4 * eventNum]
 
     # --------------------------------------------------------
     # Read / Write
@@ -142,6 +173,28 @@ class CMaxMidiTrack:
         self.outPtr += 1
         return ev
 
+    def ReadInto(self, out, numEvents=None):
+        """
+        Copy up to numEvents consecutive events into caller storage.
+
+        out is a MidiEvent ctypes array (or other writable packed-event
+        buffer). One memmove fills a whole playback buffer, instead of
+        Read() materializing a Python-level view per event — and the
+        caller owns the copy, so a later _grow can't invalidate it.
+        Advances the read pointer and returns the number of events.
+        """
+        if self.fMute or self.fRecord or self.lpBuffer is None:
+            return 0
+        n = min(self.inPtr - self.outPtr, len(out))
+        if numEvents is not None:
+            n = min(n, numEvents)
+        if n <= 0:
+            return 0
+        src = ctypes.addressof(self.lpBuffer) + self.outPtr * EVENT_SIZE
+        ctypes.memmove(out, src, n * EVENT_SIZE)
+        self.outPtr += n
+        return n
+
     def Write(self, event):
         if not self.fRecord:
             return
@@ -152,60 +205,135 @@ class CMaxMidiTrack:
     # --------------------------------------------------------
     def _grow(self):
         new_buf = (MidiEvent * (self.dwBufSize + BUFFER_GROW_SIZE))()
-        ctypes.memmove(new_buf, self.lpBuffer, ctypes.sizeof(self.lpBuffer))
+        if self.lpBuffer is not None and self.dwBufSize:
+            ctypes.memmove(new_buf, self.lpBuffer, EVENT_SIZE * self.dwBufSize)
         self.lpBuffer = new_buf
         self.dwBufSize += BUFFER_GROW_SIZE
+        self._flat = (ctypes.c_uint32 * (4 * self.dwBufSize)).from_buffer(new_buf)
 
     def InsertEvent(self, event, beforeEvent):
         if self.inPtr == self.dwBufSize:
             self._grow()
 
+        self._abs_cache = None
+
         if beforeEvent == -1 or beforeEvent >= self.inPtr:
             self.lpBuffer[self.inPtr] = event
             self.inPtr += 1
             return
 
-        # Shift elements
-        for i in range(self.inPtr, beforeEvent, -1):
-            self.lpBuffer[i] = self.lpBuffer[i - 1]
+        # Shift the tail up with one memmove (it handles the overlap),
+        # instead of one Python-level struct copy per element.
+        src = ctypes.addressof(self.lpBuffer) + beforeEvent * EVENT_SIZE
+        ctypes.memmove(src + EVENT_SIZE, src, (self.inPtr - beforeEvent) * EVENT_SIZE)
         self.lpBuffer[beforeEvent] = event
         self.inPtr += 1
 
+    def InsertSortedByTime(self, event, absTime=None):
+        """
+        Insert an event by absolute time, keeping the track time-ordered.
+
+        For late MIDI IN events during recording: the slot is found with
+        a binary search on the cumulative-time column instead of the
+        linear scan callers would otherwise do. event.time is rewritten
+        to the delta from its predecessor and the follower's delta is
+        adjusted to compensate. Returns the insertion index.
+
+        absTime defaults to event.time (i.e. the caller already supplies
+        an absolute timestamp, as a recording callback does).
+        """
+        when = event.time if absTime is None else absTime
+
+        if self.inPtr == 0:
+            event.time = when
+            self.InsertEvent(event, -1)
+            return 0
+
+        self.AbsNow(0)  # make sure the cumulative column is built
+        idx = bisect_right(self._abs_cache, when)
+        prev_abs = self._abs_cache[idx - 1] if idx else 0
+        event.time = when - prev_abs
+
+        if idx < self.inPtr:
+            self.lpBuffer[idx].time -= event.time
+            self.InsertEvent(event, idx)
+        else:
+            self.InsertEvent(event, -1)
+        return idx
+
     def DeleteEvent(self, eventNum):
         if eventNum < self.inPtr:
-            for i in range(eventNum, self.inPtr - 1):
-                self.lpBuffer[i] = self.lpBuffer[i + 1]
+            self._abs_cache = None
+            dst = ctypes.addressof(self.lpBuffer) + eventNum * EVENT_SIZE
+            ctypes.memmove(
+                dst, dst + EVENT_SIZE, (self.inPtr - 1 - eventNum) * EVENT_SIZE
+            )
             self.inPtr -= 1
 
     def SlideTrack(self, eventNum, delta):
         if eventNum < self.inPtr:
-            self.lpBuffer[eventNum].time = max(
-                0, self.lpBuffer[eventNum].time + delta
-            )
+            self._abs_cache = None
+            i = 4 * eventNum
+            t = self._flat[i] + delta
+            self._flat[i] = t if t > 0 else 0
+
+    def SlideEvents(self, startEvent, numEvents, delta):
+        """Shift a range of delta times by delta ticks (clamped at 0)."""
+        end = min(self.inPtr, startEvent + numEvents)
+        if startEvent >= end:
+            return
+        self._abs_cache = None
+        # Plain int stores through the flat view; no per-event
+        # Structure round trip.
+        flat = self._flat
+        for i in range(4 * startEvent, 4 * end, 4):
+            t = flat[i] + delta
+            flat[i] = t if t > 0 else 0
 
     # --------------------------------------------------------
     # Absolute / Delta Time
     # --------------------------------------------------------
+    def _time_column(self):
+        """
+        The time field of every live event as a list of plain ints.
+
+        All four MidiEvent fields are uint32, so the buffer doubles as a
+        flat uint32 array; a strided slice of that view pulls the time
+        column in one C pass — no per-event Structure objects, which is
+        what makes bulk scans here memory-bound rather than
+        marshalling-bound.
+        """
+        if self.inPtr == 0:
+            return []
+        return self._flat[0 : 4 * self.inPtr : 4]
+
     def AbsNow(self, eventNum):
         if eventNum >= self.inPtr:
             return 0
-        total = 0
-        for i in range(eventNum + 1):
-            total += self.lpBuffer[i].time
-        return total
+        cache = self._abs_cache
+        if cache is None:
+            cache = self._abs_cache = list(accumulate(self._time_column()))
+        return cache[eventNum]
 
     def DeltaToAbs(self, buf, startEvent, numEvents):
         now = self.AbsNow(startEvent)
-        buf[0].time = now
-        for i in range(1, numEvents):
-            now += buf[i].time
-            buf[i].time = now
+        # buf entries may alias lpBuffer (GetAbsBuffer), so the stored
+        # deltas change under us — drop the cache after the lookup.
+        self._abs_cache = None
+        # accumulate runs the carry chain at C speed; the interpreted
+        # loop is left with one store per event.
+        times = accumulate((buf[i].time for i in range(1, numEvents)),
+                           initial=now)
+        for i, t in enumerate(times):
+            buf[i].time = t
 
     def AbsToDelta(self, buf, startEvent, numEvents):
         start = 0 if startEvent == 0 else self.AbsNow(startEvent - 1)
+        self._abs_cache = None
         for i in range(numEvents):
-            now = buf[i].time
-            buf[i].time -= start
+            ev = buf[i]
+            now = ev.time
+            ev.time = now - start
             start = now
 
     def GetAbsBuffer(self, startEvent, numEvents):